@@ -1,16 +1,64 @@
 import pandas as pd
+import numpy as np
 import logging
-from typing import List, Dict
+import gc
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Tuple
 import json
+import orjson
+import pyarrow.parquet as pq
 import os
+import re
+import tempfile
 
 # Set up logging
 logging.basicConfig(level=logging.INFO,
                     format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# With copy-on-write, the dropna calls and boolean slices in the analyzers
+# share the parent's buffers until something writes to them, instead of
+# copying eagerly. It is always on from pandas 3, which deprecates the option.
+if int(pd.__version__.split('.')[0]) < 3:
+    pd.set_option('mode.copy_on_write', True)
+
+# Matches the genre names inside the stringified list of dicts in the metadata
+GENRE_NAME_PATTERN = re.compile(r"'name':\s*'([^']*)'")
+
+# Number of rows read at a time when aggregating the ratings file
+RATINGS_CHUNK_SIZE = 1_000_000
+
+# Number of rows encoded at a time when saving the metadata to JSON
+JSON_CHUNK_SIZE = 4096
+
+
+def _group_sum_count(keys: np.ndarray, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compute the sum and count of the values for each distinct key.
+
+    The values are sorted by key so that each group is a contiguous run,
+    which is then reduced with np.add.reduceat.
+
+    Args:
+        keys (np.ndarray): Group key of each value.
+        values (np.ndarray): Values to aggregate.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: Sorted distinct keys, and the sum and count of each group.
+    """
+    order = np.argsort(keys, kind='stable')
+    sorted_keys = keys[order]
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(sorted_keys)) + 1))
+    sums = np.add.reduceat(values[order], starts)
+    counts = np.diff(np.append(starts, len(sorted_keys)))
+    return sorted_keys[starts], sums, counts
+
 
 class MovieAnalyzer:
+    __slots__ = ('metadata_path', 'ratings_path', 'credits_path', 'keywords_path', 'links_path',
+                 'metadata_df', '_keywords_df', '_credits_df', '_links_df',
+                 '_rating_sums', '_rating_counts', '_titles_by_id', '_genre_series')
+
     def __init__(self, metadata_path: str, ratings_path: str, credits_path: str, keywords_path: str, links_path: str):
         """
         Initialize the MovieAnalyzer with paths to the necessary CSV files.
@@ -28,23 +76,195 @@ class MovieAnalyzer:
         self.keywords_path = keywords_path
         self.links_path = links_path
 
-        self.links_df = None
-        self.keywords_df = None
-        self.credits_df = None
-        self.ratings_df = None
+        self._links_df = None
+        self._keywords_df = None
+        self._credits_df = None
+        self._rating_sums = None
+        self._rating_counts = None
         self.metadata_df = None
+        self._titles_by_id = None
+        self._genre_series = None
+
+    @property
+    def credits_df(self) -> pd.DataFrame:
+        """
+        Get the credits dataset, loading it from the CSV file on first access.
+
+        Returns:
+            pd.DataFrame: The credits dataset.
+        """
+        if self._credits_df is None:
+            self._credits_df = self._read_csv(
+                self.credits_path, engine='pyarrow')
+        return self._credits_df
+
+    @property
+    def keywords_df(self) -> pd.DataFrame:
+        """
+        Get the keywords dataset, loading it from the CSV file on first access.
+
+        Returns:
+            pd.DataFrame: The keywords dataset.
+        """
+        if self._keywords_df is None:
+            self._keywords_df = self._read_csv(
+                self.keywords_path, engine='pyarrow')
+        return self._keywords_df
+
+    @property
+    def links_df(self) -> pd.DataFrame:
+        """
+        Get the links dataset, loading it from the CSV file on first access.
+
+        Returns:
+            pd.DataFrame: The links dataset.
+        """
+        if self._links_df is None:
+            self._links_df = self._read_csv(self.links_path, engine='pyarrow')
+        return self._links_df
+
+    @staticmethod
+    def _read_parquet_cache(cache_path: str, path: str, **kwargs) -> Optional[pd.DataFrame]:
+        """
+        Read a Parquet cache of a CSV file, if it is usable.
+
+        The cache is usable when it is at least as new as the CSV file, can be
+        read, and holds exactly the columns a CSV read with the same options
+        would return, converted to the requested dtypes.
+
+        Args:
+            cache_path (str): Path to the Parquet cache.
+            path (str): Path to the CSV file.
+            **kwargs: Extra keyword arguments passed to pd.read_csv.
+
+        Returns:
+            Optional[pd.DataFrame]: The cached dataset, or None if the cache is unusable.
+        """
+        if not os.path.exists(cache_path) or os.path.getmtime(cache_path) < os.path.getmtime(path):
+            return None
+        try:
+            columns = kwargs.get('usecols')
+            if columns is None:
+                columns = pd.read_csv(path, nrows=0).columns.tolist()
+            if set(pq.read_schema(cache_path).names) != set(columns):
+                logger.info(f"Ignoring Parquet cache {cache_path} with different columns")
+                return None
+            df = pd.read_parquet(cache_path, engine='pyarrow')
+            if 'dtype' in kwargs:
+                df = df.astype(kwargs['dtype'])
+            return df
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable Parquet cache {cache_path}: {str(e)}")
+            return None
+
+    @staticmethod
+    def _read_csv(path: str, **kwargs) -> pd.DataFrame:
+        """
+        Read a CSV file, using a sibling Parquet file as a cache.
+
+        The Parquet cache is used when it is at least as new as the CSV file and
+        matches the requested columns. Otherwise the CSV file is parsed and the
+        cache is (re)written atomically, so an interrupted write never leaves a
+        truncated cache behind.
+
+        Args:
+            path (str): Path to the CSV file.
+            **kwargs: Extra keyword arguments passed to pd.read_csv.
+
+        Returns:
+            pd.DataFrame: The loaded dataset.
+        """
+        cache_path = os.path.splitext(path)[0] + '.parquet'
+        df = MovieAnalyzer._read_parquet_cache(cache_path, path, **kwargs)
+        if df is not None:
+            return df
+
+        df = pd.read_csv(path, **kwargs)
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(
+                suffix='.parquet.tmp', dir=os.path.dirname(cache_path) or '.')
+            os.close(fd)
+            df.to_parquet(tmp_path, engine='pyarrow',
+                          compression='zstd', index=False)
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            logger.warning(f"Could not cache {path} as Parquet: {str(e)}")
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        return df
+
+    @staticmethod
+    def _aggregate_ratings(path: str) -> Tuple[pd.Series, pd.Series]:
+        """
+        Stream the ratings CSV file and aggregate the ratings per movie.
+
+        Only the running sum and count of the ratings of each movie are kept,
+        so the ratings are never held in memory all at once.
+
+        Args:
+            path (str): Path to the ratings CSV file.
+
+        Returns:
+            Tuple[pd.Series, pd.Series]: Sum and count of the ratings, indexed by movie id.
+        """
+        sums = pd.Series(dtype='float64')
+        counts = pd.Series(dtype='float64')
+        chunks = pd.read_csv(path, usecols=['movieId', 'rating'],
+                             dtype={'movieId': 'int32', 'rating': 'float32'},
+                             chunksize=RATINGS_CHUNK_SIZE)
+        for chunk in chunks:
+            if chunk.empty:
+                continue
+            movie_ids, chunk_sums, chunk_counts = _group_sum_count(
+                chunk['movieId'].to_numpy(), chunk['rating'].to_numpy('float64'))
+            sums = sums.add(pd.Series(chunk_sums, index=movie_ids), fill_value=0)
+            counts = counts.add(pd.Series(chunk_counts, index=movie_ids), fill_value=0)
+        return sums, counts.astype('int64')
 
     def load_data(self) -> None:
         """
         Load the datasets from the CSV files into pandas DataFrames.
+
+        The files are read concurrently. Only the columns used by the analysis
+        are loaded, with explicit dtypes to skip type inference. The ratings
+        file is aggregated per movie while it is read instead of being kept in
+        memory. Other parsed files are cached next to the CSV files in Parquet
+        format, so subsequent runs skip the CSV parsing. The credits, keywords
+        and links files are not needed by the analysis and are only loaded on
+        first access to credits_df, keywords_df or links_df.
         """
         try:
-            self.metadata_df = pd.read_csv(
-                self.metadata_path, low_memory=False)
-            self.ratings_df = pd.read_csv(self.ratings_path)
-            self.credits_df = pd.read_csv(self.credits_path)
-            self.keywords_df = pd.read_csv(self.keywords_path)
-            self.links_df = pd.read_csv(self.links_path)
+            # The files are independent and parsed by C code that releases
+            # the GIL, so they are read concurrently
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                # The metadata file has quoted fields spanning several lines,
+                # which the pyarrow engine does not handle, so it uses the C engine
+                metadata_future = executor.submit(
+                    self._read_csv, self.metadata_path,
+                    usecols=['id', 'title', 'release_date', 'genres'],
+                    dtype={'id': 'string', 'title': 'string',
+                           'release_date': 'string', 'genres': 'string'})
+                ratings_future = executor.submit(
+                    self._aggregate_ratings, self.ratings_path)
+
+                self.metadata_df = metadata_future.result()
+                self._rating_sums, self._rating_counts = ratings_future.result()
+
+            self.metadata_df['id'] = pd.to_numeric(
+                self.metadata_df['id'], errors='coerce').astype('Int32')
+            self.metadata_df['release_year'] = pd.to_datetime(
+                self.metadata_df['release_date'], errors='coerce',
+                format='%Y-%m-%d').dt.year.astype('Int16')
+            # Genre names are parsed lazily from the freshly loaded metadata
+            self._genre_series = None
+            titles = self.metadata_df.dropna(
+                subset=['id']).drop_duplicates('id')
+            self._titles_by_id = pd.Series(
+                titles['title'].to_numpy(), index=titles['id'].to_numpy('int32'), name='title')
+            # Replaced columns are freed by reference counting already; this
+            # only reclaims reference cycles left behind by the loading phase
+            gc.collect()
             logger.info("All data loaded successfully")
         except FileNotFoundError as e:
             logger.error(f"File not found: {str(e)}")
@@ -72,7 +292,7 @@ class MovieAnalyzer:
         Returns:
             float: Average rating of all movies.
         """
-        return self.ratings_df['rating'].mean()
+        return self._rating_sums.sum() / self._rating_counts.sum()
 
     def top_rated_movies(self, n: int = 5) -> List[Dict]:
         """
@@ -84,13 +304,43 @@ class MovieAnalyzer:
         Returns:
             List[Dict]: List of dictionaries containing title and average rating of top rated movies.
         """
-        avg_ratings = self.ratings_df.groupby(
-            'movieId')['rating'].mean().reset_index()
-        self.metadata_df['id'] = pd.to_numeric(
-            self.metadata_df['id'], errors='coerce')
-        top_movies = avg_ratings.merge(
-            self.metadata_df[['id', 'title']], left_on='movieId', right_on='id', how='inner')
-        return top_movies.nlargest(n, 'rating')[['title', 'rating']].to_dict('records')
+        avg_ratings = (self._rating_sums /
+                       self._rating_counts).rename('rating')
+        avg_ratings = avg_ratings[avg_ratings.index.isin(
+            self._titles_by_id.index)]
+        top_ratings = avg_ratings.nlargest(n)
+        top_titles = self._titles_by_id.reindex(top_ratings.index)
+        return [{'title': title, 'rating': float(rating)}
+                for title, rating in zip(top_titles, top_ratings)]
+
+    def weighted_score(self, w_rating: float = 1.0, w_count: float = 1.0, n: int = 5) -> List[Dict]:
+        """
+        Get the top n movies by a score weighing average rating against popularity.
+
+        The score is w_rating * average rating + w_count * log(1 + number of ratings).
+        It is evaluated with numexpr, which computes it in a single pass without
+        intermediate columns.
+
+        Args:
+            w_rating (float): Weight of the average rating. Defaults to 1.0.
+            w_count (float): Weight of the log number of ratings. Defaults to 1.0.
+            n (int): Number of top scored movies to return. Defaults to 5.
+
+        Returns:
+            List[Dict]: List of dictionaries containing title, average rating, number of ratings and score.
+        """
+        stats = pd.DataFrame({'rating': self._rating_sums / self._rating_counts,
+                              'num_ratings': self._rating_counts})
+        stats = stats[stats.index.isin(self._titles_by_id.index)]
+        stats = stats.eval(
+            'score = rating * @w_rating + log1p(num_ratings) * @w_count', engine='numexpr')
+        top_movies = stats.nlargest(n, 'score')
+        top_titles = self._titles_by_id.reindex(top_movies.index)
+        return [{'title': title, 'rating': float(rating),
+                 'num_ratings': int(num_ratings), 'score': float(score)}
+                for title, rating, num_ratings, score in zip(
+                    top_titles, top_movies['rating'],
+                    top_movies['num_ratings'], top_movies['score'])]
 
     def movies_per_year(self) -> Dict[int, int]:
         """
@@ -99,27 +349,27 @@ class MovieAnalyzer:
         Returns:
             Dict[int, int]: Dictionary with years as keys and movie counts as values.
         """
-        self.metadata_df['release_date'] = pd.to_datetime(
-            self.metadata_df['release_date'], errors='coerce')
-        self.metadata_df['release_year'] = self.metadata_df['release_date'].dt.year
-        return self.metadata_df['release_year'].value_counts().sort_index().to_dict()
+        years = self.metadata_df['release_year'].dropna().to_numpy('int32')
+        if years.size == 0:
+            return {}
+        first_year = years.min()
+        counts = np.bincount(years - first_year)
+        present = np.flatnonzero(counts)
+        return dict(zip((present + first_year).tolist(), counts[present].tolist()))
 
     def movies_per_genre(self) -> Dict[str, int]:
         """
         Get the number of movies in each genre.
 
+        The genre names are parsed on the first call and reused afterwards.
+
         Returns:
             Dict[str, int]: Dictionary with genres as keys and movie counts as values.
         """
-        def parse_genres(genres_str):
-            try:
-                genres_list = eval(genres_str)
-                return [genre['name'] for genre in genres_list]
-            except (SyntaxError, TypeError, KeyError):
-                return []
-
-        genres = self.metadata_df['genres'].apply(parse_genres).explode()
-        return genres.value_counts().to_dict()
+        if self._genre_series is None:
+            self._genre_series = self.metadata_df['genres'].fillna('').astype(str).str.findall(
+                GENRE_NAME_PATTERN).explode().astype('category')
+        return self._genre_series.value_counts().to_dict()
 
     def top_keywords(self, n: int = 10) -> List[Dict]:
         """
@@ -130,19 +380,52 @@ class MovieAnalyzer:
 
         Returns:
             List[Dict]: List of dictionaries containing keyword and its count.
+
+        Raises:
+            ValueError: If the keywords file has no 'name' column.
         """
-        return self.keywords_df['name'].value_counts().nlargest(n).reset_index().rename(
-            columns={'index': 'keyword', 'name': 'count'}).to_dict('records')
+        if 'name' not in self.keywords_df.columns:
+            raise ValueError(
+                f"Keywords file {self.keywords_path} has no 'name' column")
+        counts = self.keywords_df['name'].value_counts().head(n)
+        return [{'keyword': keyword, 'count': int(count)} for keyword, count in counts.items()]
 
     def save_to_json(self, output_path: str) -> None:
         """
         Save the metadata dataset to a JSON file.
 
+        The metadata is streamed from the CSV file, so every metadata column is
+        exported, not only the ones loaded for the analysis. Values are
+        exported as the strings found in the file, since the raw columns mix
+        types (e.g. malformed ids) and a type inferred per chunk would differ
+        between records. Note that this parses the metadata CSV a second time,
+        bypassing both the loaded metadata_df and its Parquet cache, which
+        only hold the analysed columns.
+
         Args:
             output_path (str): Path to save the JSON file.
         """
         try:
-            self.metadata_df.to_json(output_path, orient='records')
+            # Records are read, encoded and written a chunk at a time, so
+            # neither the full metadata nor the whole JSON document is ever
+            # held in memory
+            with open(output_path, 'wb') as f:
+                f.write(b'[')
+                first = True
+                chunks = pd.read_csv(self.metadata_path, dtype=str,
+                                     chunksize=JSON_CHUNK_SIZE)
+                for chunk in chunks:
+                    if chunk.empty:
+                        continue
+                    # orjson cannot encode pd.NA or NaN as null, so missing values become None
+                    records = chunk.astype(object).where(
+                        chunk.notna(), None).to_dict('records')
+                    if not first:
+                        f.write(b',')
+                    f.write(b','.join(orjson.dumps(record, option=orjson.OPT_SERIALIZE_NUMPY)
+                                      for record in records))
+                    first = False
+                f.write(b']')
             logger.info(f"Data saved successfully to {output_path}")
         except Exception as e:
             logger.error(f"Error saving data to JSON: {str(e)}")
@@ -174,6 +457,10 @@ def main():
         for movie in analyzer.top_rated_movies():
             print(f"{movie['title']} - {movie['rating']:.2f}")
 
+        print("\nTop 5 movies by weighted score:")
+        for movie in analyzer.weighted_score():
+            print(f"{movie['title']} - {movie['score']:.2f}")
+
         print("\nMovies released each year:")
         for year, count in analyzer.movies_per_year().items():
             print(f"{year}: {count}")
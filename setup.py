@@ -5,7 +5,10 @@ setup(
     version="0.1.0",
     packages=find_packages(),
     install_requires=[
-        "pandas",
+        "pandas>=1.5",
+        "pyarrow",
+        "orjson",
+        "numexpr",
     ],
     entry_points={
         "console_scripts": [
@@ -0,0 +1,32 @@
+import pytest
+
+from movie_analyzer.main import MovieAnalyzer
+
+
+@pytest.fixture
+def write_csv(tmp_path):
+    """
+    Write a CSV file into the test's temporary directory and return its path.
+    """
+    def write(name, text):
+        path = tmp_path / name
+        path.write_text(text)
+        return str(path)
+    return write
+
+
+@pytest.fixture
+def make_analyzer(write_csv):
+    """
+    Write the given CSV contents into the test's temporary directory and return
+    a MovieAnalyzer over them, without loading the data.
+    """
+    def make(metadata='id,title,release_date,genres\n',
+             ratings='userId,movieId,rating,timestamp\n',
+             keywords='id,name\n'):
+        return MovieAnalyzer(write_csv('movies_metadata.csv', metadata),
+                             write_csv('ratings.csv', ratings),
+                             write_csv('credits.csv', 'cast,crew,id\n'),
+                             write_csv('keywords.csv', keywords),
+                             write_csv('links.csv', 'movieId,imdbId,tmdbId\n'))
+    return make
@@ -0,0 +1,48 @@
+import pandas as pd
+import pytest
+
+from movie_analyzer import main
+from movie_analyzer.main import MovieAnalyzer
+
+RATINGS = (
+    'userId,movieId,rating,timestamp\n'
+    '1,10,4.0,0\n'
+    '2,20,2.0,0\n'
+    '3,10,5.0,0\n'
+    '4,10,3.0,0\n'
+    '5,20,1.5,0\n'
+)
+
+
+def test_sums_and_counts_across_chunk_boundaries(write_csv, monkeypatch):
+    monkeypatch.setattr(main, 'RATINGS_CHUNK_SIZE', 2)
+    path = write_csv('ratings.csv', RATINGS)
+
+    sums, counts = MovieAnalyzer._aggregate_ratings(path)
+
+    assert sums.to_dict() == {10: 12.0, 20: 3.5}
+    assert counts.to_dict() == {10: 3, 20: 2}
+
+
+def test_average_rating_across_chunk_boundaries(make_analyzer, monkeypatch):
+    monkeypatch.setattr(main, 'RATINGS_CHUNK_SIZE', 2)
+    analyzer = make_analyzer(ratings=RATINGS)
+    analyzer.load_data()
+
+    assert analyzer.average_rating() == pytest.approx(15.5 / 5)
+
+
+def test_header_only_file(write_csv):
+    path = write_csv('ratings.csv', 'userId,movieId,rating,timestamp\n')
+
+    sums, counts = MovieAnalyzer._aggregate_ratings(path)
+
+    assert sums.empty
+    assert counts.empty
+
+
+def test_empty_file(write_csv):
+    path = write_csv('ratings.csv', '')
+
+    with pytest.raises(pd.errors.EmptyDataError):
+        MovieAnalyzer._aggregate_ratings(path)
@@ -0,0 +1,33 @@
+import os
+
+METADATA = (
+    'id,title,release_date,genres\n'
+    '1,Toy Story,1995-10-30,"[{\'id\': 16, \'name\': \'Animation\'}, {\'id\': 35, \'name\': \'Comedy\'}]"\n'
+    '2,Jumanji,1995-12-15,"[{\'id\': 12, \'name\': \'Adventure\'}, {\'id\': 35,\'name\':\'Comedy\'}]"\n'
+    '3,No Genres,1995-12-22,[]\n'
+    '4,Missing Genres,1995-12-22,\n'
+    '5,Science Fiction,1996-01-01,"[{\'id\': 878, \'name\': \'Science Fiction\'}]"\n'
+)
+
+
+def test_counts_parsed_genre_names(make_analyzer):
+    analyzer = make_analyzer(metadata=METADATA)
+    analyzer.load_data()
+
+    assert analyzer.movies_per_genre() == {
+        'Comedy': 2, 'Animation': 1, 'Adventure': 1, 'Science Fiction': 1}
+
+
+def test_reload_resets_parsed_genres(tmp_path, make_analyzer, write_csv):
+    analyzer = make_analyzer(metadata=METADATA)
+    analyzer.load_data()
+    analyzer.movies_per_genre()
+    write_csv('movies_metadata.csv',
+              'id,title,release_date,genres\n'
+              '1,Heat,1995-12-15,"[{\'id\': 80, \'name\': \'Crime\'}]"\n')
+    # Make sure the Parquet cache of the first load is seen as stale
+    os.utime(tmp_path / 'movies_metadata.parquet', (0, 0))
+
+    analyzer.load_data()
+
+    assert analyzer.movies_per_genre() == {'Crime': 1}
@@ -0,0 +1,36 @@
+METADATA = (
+    'id,title,release_date,genres\n'
+    '1,A,1995-10-30,[]\n'
+    '2,B,1874-12-09,[]\n'
+    '3,C,1995-01-01,[]\n'
+    '4,D,,[]\n'
+    '5,E,not a date,[]\n'
+    '6,F,1998-06-01,[]\n'
+)
+
+
+def test_counts_years_in_order_without_empty_years(make_analyzer):
+    analyzer = make_analyzer(metadata=METADATA)
+    analyzer.load_data()
+
+    per_year = analyzer.movies_per_year()
+
+    assert per_year == {1874: 1, 1995: 2, 1998: 1}
+    assert list(per_year) == [1874, 1995, 1998]
+
+
+def test_no_valid_dates(make_analyzer):
+    analyzer = make_analyzer(metadata='id,title,release_date,genres\n1,A,,[]\n')
+    analyzer.load_data()
+
+    assert analyzer.movies_per_year() == {}
+
+
+def test_keys_and_counts_are_plain_ints(make_analyzer):
+    analyzer = make_analyzer(metadata=METADATA)
+    analyzer.load_data()
+
+    per_year = analyzer.movies_per_year()
+
+    assert all(type(year) is int for year in per_year)
+    assert all(type(count) is int for count in per_year.values())
@@ -0,0 +1,64 @@
+import os
+
+import pandas as pd
+import pytest
+
+from movie_analyzer import main
+from movie_analyzer.main import MovieAnalyzer
+
+
+def test_cache_miss_writes_cache(tmp_path, write_csv):
+    path = write_csv('links.csv', 'movieId,tmdbId\n1,10\n2,20\n')
+
+    df = MovieAnalyzer._read_csv(path)
+
+    assert df.to_dict('list') == {'movieId': [1, 2], 'tmdbId': [10, 20]}
+    assert os.path.exists(tmp_path / 'links.parquet')
+    assert [name for name in os.listdir(tmp_path) if name.endswith('.tmp')] == []
+
+
+def test_cache_hit_applies_dtype(write_csv):
+    path = write_csv('links.csv', 'movieId,tmdbId\n1,10\n2,20\n')
+    MovieAnalyzer._read_csv(path, usecols=['movieId'])
+    # Make a cache hit observable: the CSV now differs, but is older
+    write_csv('links.csv', 'movieId,tmdbId\n3,30\n')
+    os.utime(path, (0, 0))
+
+    df = MovieAnalyzer._read_csv(path, usecols=['movieId'], dtype={'movieId': 'int32'})
+
+    assert df['movieId'].tolist() == [1, 2]
+    assert df['movieId'].dtype == 'int32'
+
+
+def test_cache_with_other_columns_is_a_miss(write_csv):
+    path = write_csv('links.csv', 'movieId,tmdbId\n1,10\n')
+    MovieAnalyzer._read_csv(path, usecols=['movieId'])
+
+    df = MovieAnalyzer._read_csv(path)
+
+    assert df.columns.tolist() == ['movieId', 'tmdbId']
+
+
+def test_corrupt_cache_falls_back_to_csv(tmp_path, write_csv):
+    path = write_csv('links.csv', 'movieId,tmdbId\n1,10\n')
+    (tmp_path / 'links.parquet').write_bytes(b'truncated')
+
+    df = MovieAnalyzer._read_csv(path)
+
+    assert df.to_dict('list') == {'movieId': [1], 'tmdbId': [10]}
+    assert MovieAnalyzer._read_csv(path).equals(df)
+
+
+def raise_permission_error(*args, **kwargs):
+    raise PermissionError('read-only directory')
+
+
+@pytest.mark.parametrize('target', [(main.tempfile, 'mkstemp'), (pd.DataFrame, 'to_parquet')])
+def test_failed_cache_write_still_returns_frame(tmp_path, write_csv, monkeypatch, target):
+    path = write_csv('links.csv', 'movieId,tmdbId\n1,10\n')
+    monkeypatch.setattr(*target, raise_permission_error)
+
+    df = MovieAnalyzer._read_csv(path)
+
+    assert df.to_dict('list') == {'movieId': [1], 'tmdbId': [10]}
+    assert os.listdir(tmp_path) == ['links.csv']
@@ -0,0 +1,44 @@
+import json
+
+import pytest
+
+from movie_analyzer import main
+from movie_analyzer.main import MovieAnalyzer
+
+
+@pytest.mark.parametrize('n_rows', [3, 4])
+def test_framing_at_chunk_boundaries(tmp_path, write_csv, monkeypatch, n_rows):
+    monkeypatch.setattr(main, 'JSON_CHUNK_SIZE', 3)
+    rows = ''.join(f'{i},Movie {i},\n' if i % 2 else f'{i},,7.5\n'
+                   for i in range(n_rows))
+    metadata_path = write_csv('movies_metadata.csv',
+                              'id,title,vote_average\n' + rows)
+    output_path = tmp_path / 'movies_metadata.json'
+
+    MovieAnalyzer(metadata_path, '', '', '', '').save_to_json(str(output_path))
+
+    records = json.loads(output_path.read_text())
+    assert [record['id'] for record in records] == [str(i) for i in range(n_rows)]
+    assert records[0] == {'id': '0', 'title': None, 'vote_average': '7.5'}
+    assert records[1] == {'id': '1', 'title': 'Movie 1', 'vote_average': None}
+
+
+def test_types_do_not_depend_on_the_chunk(tmp_path, write_csv, monkeypatch):
+    monkeypatch.setattr(main, 'JSON_CHUNK_SIZE', 2)
+    metadata_path = write_csv('movies_metadata.csv',
+                              'adult,budget,id\n'
+                              'False,100,1\n'
+                              'False,0,2\n'
+                              'False,5,1997-08-20\n'
+                              '- Written by Ørnås,,\n')
+    output_path = tmp_path / 'movies_metadata.json'
+
+    MovieAnalyzer(metadata_path, '', '', '', '').save_to_json(str(output_path))
+
+    records = json.loads(output_path.read_text())
+    assert records == [
+        {'adult': 'False', 'budget': '100', 'id': '1'},
+        {'adult': 'False', 'budget': '0', 'id': '2'},
+        {'adult': 'False', 'budget': '5', 'id': '1997-08-20'},
+        {'adult': '- Written by Ørnås', 'budget': None, 'id': None},
+    ]
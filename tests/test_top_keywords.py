@@ -0,0 +1,20 @@
+import pytest
+
+
+def test_missing_name_column_raises_clear_error(make_analyzer):
+    analyzer = make_analyzer(
+        keywords='id,keywords\n862,"[{\'id\': 931, \'name\': \'jealousy\'}]"\n')
+
+    with pytest.raises(ValueError, match="no 'name' column"):
+        analyzer.top_keywords()
+
+
+def test_returns_keyword_and_count_records(make_analyzer):
+    analyzer = make_analyzer(
+        keywords='id,name\n1,jealousy\n2,toy\n3,jealousy\n4,boy\n5,jealousy\n6,toy\n')
+
+    assert analyzer.top_keywords(n=2) == [
+        {'keyword': 'jealousy', 'count': 3},
+        {'keyword': 'toy', 'count': 2},
+    ]
+    assert all(type(record['count']) is int for record in analyzer.top_keywords())
@@ -0,0 +1,40 @@
+METADATA = (
+    'id,title,release_date,genres\n'
+    '5,Five,1995-01-01,[]\n'
+    '3,Three,1995-01-01,[]\n'
+    '7,Seven,1995-01-01,[]\n'
+)
+
+RATINGS = (
+    'userId,movieId,rating,timestamp\n'
+    '1,5,4.0,0\n'
+    '2,5,4.0,0\n'
+    '1,3,5.0,0\n'
+    '2,3,3.0,0\n'
+    '1,7,2.0,0\n'
+    '1,99,5.0,0\n'
+)
+
+
+def test_ranks_movies_with_ties_in_movie_id_order(make_analyzer):
+    analyzer = make_analyzer(metadata=METADATA, ratings=RATINGS)
+    analyzer.load_data()
+
+    # Five and Three both average 4.0; movie 99 has no metadata
+    assert analyzer.top_rated_movies(n=3) == [
+        {'title': 'Three', 'rating': 4.0},
+        {'title': 'Five', 'rating': 4.0},
+        {'title': 'Seven', 'rating': 2.0},
+    ]
+    assert analyzer.top_rated_movies(n=1) == [{'title': 'Three', 'rating': 4.0}]
+
+
+def test_repeated_metadata_ids_are_listed_once(make_analyzer):
+    analyzer = make_analyzer(
+        metadata=METADATA + '5,Five Again,1995-01-01,[]\n', ratings=RATINGS)
+    analyzer.load_data()
+
+    assert analyzer.top_rated_movies(n=2) == [
+        {'title': 'Three', 'rating': 4.0},
+        {'title': 'Five', 'rating': 4.0},
+    ]
@@ -0,0 +1,63 @@
+import math
+
+import pytest
+
+METADATA = (
+    'id,title,release_date,genres\n'
+    '1,Niche,1995-01-01,[]\n'
+    '2,Popular,1995-01-01,[]\n'
+)
+
+# Niche: one 5.0 rating. Popular: four ratings averaging 4.0. Movie 9 has no metadata
+RATINGS = (
+    'userId,movieId,rating,timestamp\n'
+    '1,1,5.0,0\n'
+    '1,2,3.0,0\n'
+    '2,2,4.0,0\n'
+    '3,2,4.0,0\n'
+    '4,2,5.0,0\n'
+    '1,9,5.0,0\n'
+    '2,9,5.0,0\n'
+    '3,9,5.0,0\n'
+    '4,9,5.0,0\n'
+    '5,9,5.0,0\n'
+)
+
+
+@pytest.fixture
+def analyzer(make_analyzer):
+    analyzer = make_analyzer(metadata=METADATA, ratings=RATINGS)
+    analyzer.load_data()
+    return analyzer
+
+
+def test_score_formula(analyzer):
+    movies = {movie['title']: movie
+              for movie in analyzer.weighted_score(w_rating=2.0, w_count=0.5)}
+
+    assert movies['Niche']['rating'] == 5.0
+    assert movies['Niche']['num_ratings'] == 1
+    assert movies['Niche']['score'] == pytest.approx(2.0 * 5.0 + 0.5 * math.log1p(1))
+    assert movies['Popular']['rating'] == 4.0
+    assert movies['Popular']['num_ratings'] == 4
+    assert movies['Popular']['score'] == pytest.approx(2.0 * 4.0 + 0.5 * math.log1p(4))
+
+
+def test_weights_change_the_ranking(analyzer):
+    by_rating = analyzer.weighted_score(w_rating=1.0, w_count=0.0)
+    by_count = analyzer.weighted_score(w_rating=0.0, w_count=1.0)
+
+    assert [movie['title'] for movie in by_rating] == ['Niche', 'Popular']
+    assert [movie['title'] for movie in by_count] == ['Popular', 'Niche']
+
+
+def test_zero_movies(analyzer):
+    assert analyzer.weighted_score(n=0) == []
+
+
+def test_movies_missing_from_metadata_are_excluded(analyzer):
+    # Movie 9 would rank first on both rating and count. With the default
+    # weights Niche scores 5 + log(2) ~ 5.69 and Popular 4 + log(5) ~ 5.61
+    titles = [movie['title'] for movie in analyzer.weighted_score(n=10)]
+
+    assert titles == ['Niche', 'Popular']